@@ -3,18 +3,56 @@
 
 import sys
 import os
-from pathlib import Path
+import hashlib
+import re
+import tempfile
+import time
+from operator import itemgetter
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QFileDialog, QSizePolicy, QStackedWidget,
-    QListWidget, QListWidgetItem, QScrollArea, QGridLayout, QFrame,
+    QListWidget, QListWidgetItem, QListView, QScrollArea, QGridLayout, QFrame,
     QMenu, QMessageBox
 )
-from PyQt5.QtCore import Qt, QSize, QUrl, QEvent, QTimer, QSettings
-from PyQt5.QtGui import QPixmap, QKeyEvent, QDesktopServices, QIcon
+from PyQt5.QtCore import (
+    Qt, QSize, QUrl, QEvent, QTimer, QSettings, QObject, QRunnable, QThreadPool,
+    QAbstractListModel, QModelIndex, pyqtSignal
+)
+from PyQt5.QtGui import (
+    QPixmap, QPixmapCache, QImage, QImageReader, QImageIOHandler, QKeyEvent, QDesktopServices, QIcon
+)
 
-SUPPORTED_FORMATS = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.tiff', '.tif'}
+SUPPORTED_FORMATS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.tiff', '.tif'})
+# str.endswith takes a tuple, which avoids slicing out the suffix per file
+IMAGE_SUFFIXES = tuple(SUPPORTED_FORMATS)
+DIGITS_RE = re.compile(r'(\d+)')
 MAX_RECENT_DIRS = 15
+RECENT_DIR_CHECK_TTL = 5.0
+# Sort method -> (key into FolderScanner's metadata tuples, reverse)
+SORT_KEYS = {
+    'name_asc': (itemgetter(3), False),
+    'name_desc': (itemgetter(3), True),
+    'date_newest': (itemgetter(1), True),
+    'date_oldest': (itemgetter(1), False),
+    'size_largest': (itemgetter(2), True),
+    'size_smallest': (itemgetter(2), False),
+}
+ICON_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'galleray.png')
+GRID_COLUMNS = 4
+GRID_OVERSCAN_ROWS = 2
+THUMBNAIL_THREADS = 4
+# Thread pool priorities: folder scans, then on-screen thumbnails, then
+# overscan (0), with thumbnail cache pruning last
+SCAN_PRIORITY = 2
+VISIBLE_THUMBNAIL_PRIORITY = 1
+CACHE_PRUNE_PRIORITY = -1
+PIXMAP_CACHE_LIMIT_KB = 256 * 1024
+THUMBNAIL_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+    'galleray', 'thumbnails'
+)
+THUMBNAIL_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+THUMBNAIL_CACHE_LIMIT_BYTES = 200 * 1024 * 1024
 
 DARK_STYLE = """
 QMainWindow, QWidget {
@@ -46,58 +84,398 @@ QPushButton:checked {
 QLabel {
     color: #a0a0a0;
 }
-QListWidget {
+QListView {
     background-color: #252525;
     border: none;
     border-radius: 4px;
     padding: 8px;
 }
-QListWidget::item {
+QListView::item {
     color: #e0e0e0;
     padding: 8px 12px;
     border-radius: 4px;
 }
-QListWidget::item:hover {
+QListView::item:hover {
     background-color: #3d3d3d;
 }
-QListWidget::item:selected {
+QListView::item:selected {
     background-color: #4a4a4a;
 }
 QScrollArea {
     background-color: #1e1e1e;
     border: none;
 }
+ThumbnailLabel {
+    background-color: #252525;
+    border-radius: 4px;
+    padding: 4px;
+}
+ThumbnailLabel:hover {
+    background-color: #3d3d3d;
+}
+QMenu#sortMenu {
+    background-color: #2d2d2d;
+    border: 1px solid #444;
+    border-radius: 4px;
+    padding: 4px;
+}
+QMenu#sortMenu::item {
+    color: #e0e0e0;
+    padding: 8px 20px;
+    border-radius: 4px;
+}
+QMenu#sortMenu::item:selected {
+    background-color: #3d3d3d;
+}
+QMenu#sortMenu::item:checked {
+    background-color: #4a4a4a;
+}
+QLabel#counterLabel {
+    font-size: 14px;
+}
+QLabel#imageLabel {
+    font-size: 16px;
+    color: #666;
+}
+QLabel#filenameLabel {
+    font-size: 12px;
+    color: #888;
+}
+QPushButton#deleteBtn {
+    background-color: #5c2626;
+    color: #e0e0e0;
+}
+QPushButton#deleteBtn:hover {
+    background-color: #7a3333;
+}
+QPushButton#deleteBtn:pressed {
+    background-color: #8a4444;
+}
+QPushButton#deleteBtn:disabled {
+    background-color: #3a2020;
+    color: #666666;
+}
+QFrame#magnifiedPanel, #magnifiedPanel QFrame,
+QFrame#recentPanel, #recentPanel QFrame {
+    background-color: #252525;
+    border-radius: 8px;
+}
+QLabel#magnifiedLabel {
+    color: #666;
+}
+QLabel#magnifiedName {
+    font-size: 11px;
+    color: #888;
+    padding: 8px;
+}
+QLabel#footerLink {
+    font-size: 11px;
+}
+QLabel#footerSeparator {
+    font-size: 11px;
+    color: #444;
+}
+QLabel#recentHeader {
+    font-size: 13px;
+    font-weight: bold;
+    color: #ccc;
+    padding: 4px;
+}
+QListWidget#recentList {
+    background-color: transparent;
+    border: none;
+    padding: 0;
+}
+QListWidget#recentList::item {
+    color: #aaa;
+    padding: 6px 8px;
+    border-radius: 4px;
+    font-size: 12px;
+}
+QListWidget#recentList::item:hover {
+    background-color: #3d3d3d;
+    color: #e0e0e0;
+}
+QListWidget#recentList::item:selected {
+    background-color: #4a4a4a;
+}
+QPushButton#clearHistoryBtn {
+    padding: 8px 12px;
+    font-size: 11px;
+    background-color: #333;
+}
 """
 
 
+def natural_sort_key(name):
+    """Sort key comparing file names case-insensitively, numbers by value."""
+    # Splitting on a captured group alternates text and digit runs
+    parts = DIGITS_RE.split(name.lower())
+    return [int(part) if i % 2 else part for i, part in enumerate(parts)]
+
+
+def pixmap_cache_key(meta, width, height):
+    """QPixmapCache key for an image_meta entry scaled to fit width x height.
+
+    The file's mtime and size are part of the key, so an image edited on
+    disk is decoded again after a rescan rather than served from memory.
+    """
+    path, mtime_ns, size = meta[:3]
+    return f"{path}|{mtime_ns}|{size}|{width}x{height}"
+
+
+def read_scaled_image(path, width, height, smooth=True):
+    """Decode an image directly at the size it fits into width x height.
+
+    With smooth=False, sources larger than the target by no more than twice
+    are shrunk with nearest-neighbour sampling instead of a smoothing filter.
+    """
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    size = reader.size()
+    if not size.isValid():
+        # The format can't report its size up front; decode, then scale
+        image = reader.read()
+        if image.isNull():
+            return image
+        return image.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+    # The scaled size applies before the EXIF rotation
+    rotated = reader.transformation() & QImageIOHandler.TransformationRotate90
+    if rotated:
+        size.transpose()
+    target = size.scaled(width, height, Qt.KeepAspectRatio)
+    # Upscales keep the smoothing filter; nearest-neighbour would look blocky
+    near_size = (target.width() <= size.width() <= 2 * target.width()
+                 and target.height() <= size.height() <= 2 * target.height())
+    if not smooth and near_size:
+        return reader.read().scaled(target, Qt.IgnoreAspectRatio, Qt.FastTransformation)
+
+    reader.setScaledSize(target.transposed() if rotated else target)
+    return reader.read()
+
+
+def thumbnail_cache_path(path, mtime_ns, size):
+    """Return the cached thumbnail file for path, keyed by its path, mtime and size."""
+    key = f"{os.path.abspath(path)}|{mtime_ns}|{size}"
+    digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    # Fan out over subdirectories so no single directory grows huge
+    return os.path.join(THUMBNAIL_CACHE_DIR, digest[:2], digest + '.png')
+
+
+class ImageLoaderSignals(QObject):
+    loaded = pyqtSignal(str, QImage)
+
+
+class ImageLoader(QRunnable):
+    """Decodes an image scaled to fit width x height off the GUI thread."""
+
+    def __init__(self, image_path, width, height):
+        super().__init__()
+        self.image_path = image_path
+        self.width = width
+        self.height = height
+        self.signals = ImageLoaderSignals()
+
+    def run(self):
+        image = read_scaled_image(self.image_path, self.width, self.height)
+        self.signals.loaded.emit(self.image_path, image)
+
+
+class ThumbLoader(QRunnable):
+    """Decodes and scales a thumbnail off the GUI thread."""
+
+    def __init__(self, image_path):
+        super().__init__()
+        self.image_path = image_path
+        self.cancelled = False
+        self.signals = ImageLoaderSignals()
+
+    def run(self):
+        if self.cancelled:
+            return
+        try:
+            st = os.stat(self.image_path)
+            cache_path = thumbnail_cache_path(self.image_path, st.st_mtime_ns, st.st_size)
+        except OSError:
+            cache_path = None
+
+        image = QImage(cache_path) if cache_path else QImage()
+        if not image.isNull():
+            # Mark the entry as recently used for ThumbnailCachePruner
+            try:
+                os.utime(cache_path)
+            except OSError:
+                pass
+        else:
+            image = read_scaled_image(self.image_path, 140, 140, smooth=False)
+            if cache_path and not image.isNull():
+                self.save_to_cache(image, cache_path)
+        self.signals.loaded.emit(self.image_path, image)
+
+    @staticmethod
+    def save_to_cache(image, cache_path):
+        # Write to a temporary file first so readers never see a partial file;
+        # each writer gets its own, as a cancelled loader may still be saving
+        cache_dir = os.path.dirname(cache_path)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix='.part')
+            os.close(fd)
+        except OSError:
+            return
+        try:
+            if image.save(temp_path, 'PNG'):
+                os.replace(temp_path, cache_path)
+                return
+        except OSError:
+            pass
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
+class ThumbnailCachePruner(QRunnable):
+    """Trims the on-disk thumbnail cache off the GUI thread.
+
+    Entries unused for THUMBNAIL_CACHE_MAX_AGE are removed, then the least
+    recently used ones until the cache fits in THUMBNAIL_CACHE_LIMIT_BYTES.
+    """
+
+    def run(self):
+        cutoff = time.time() - THUMBNAIL_CACHE_MAX_AGE
+        entries = []
+        try:
+            with os.scandir(THUMBNAIL_CACHE_DIR) as top:
+                subdirs = [d.path for d in top if d.is_dir()]
+        except OSError:
+            return
+
+        # Entries may vanish mid-scan, e.g. pruned by another instance
+        for subdir in subdirs:
+            try:
+                with os.scandir(subdir) as it:
+                    for e in it:
+                        try:
+                            st = e.stat()
+                        except OSError:
+                            continue
+                        if st.st_mtime < cutoff:
+                            self.remove(e.path)
+                        else:
+                            entries.append((st.st_mtime, st.st_size, e.path))
+            except OSError:
+                continue
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= THUMBNAIL_CACHE_LIMIT_BYTES:
+                break
+            self.remove(path)
+            total -= size
+
+    @staticmethod
+    def remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class FolderScannerSignals(QObject):
+    finished = pyqtSignal(int, list)
+
+
+class FolderScanner(QRunnable):
+    """Lists the images in a folder off the GUI thread.
+
+    Emits (path, mtime_ns, size, name sort key, name) tuples, so sorting by any
+    method afterwards needs no further filesystem access.
+    """
+
+    def __init__(self, folder, scan_id):
+        super().__init__()
+        self.folder = folder
+        self.scan_id = scan_id
+        self.signals = FolderScannerSignals()
+
+    def run(self):
+        image_meta = []
+        try:
+            with os.scandir(self.folder) as it:
+                for e in it:
+                    if e.name.lower().endswith(IMAGE_SUFFIXES) and e.is_file():
+                        st = e.stat()
+                        image_meta.append((
+                            e.path, st.st_mtime_ns, st.st_size,
+                            natural_sort_key(e.name), e.name
+                        ))
+        except OSError:
+            image_meta = []
+        self.signals.finished.emit(self.scan_id, image_meta)
+
+
+class ImageListModel(QAbstractListModel):
+    """List view model that reads rows straight from the gallery's images."""
+
+    def __init__(self, gallery, parent=None):
+        super().__init__(parent)
+        self.gallery = gallery
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.gallery.images)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return f"{index.row() + 1}. {self.gallery.basenames[index.row()]}"
+        return None
+
+
 class ThumbnailLabel(QLabel):
     """Thumbnail with hover magnification."""
 
-    def __init__(self, image_path, index, gallery, parent=None):
+    def __init__(self, meta, index, gallery, parent=None, priority=0):
         super().__init__(parent)
-        self.image_path = image_path
-        self.index = index
         self.gallery = gallery
         self.setFixedSize(150, 150)
         self.setAlignment(Qt.AlignCenter)
-        self.setStyleSheet("""
-            QLabel {
-                background-color: #252525;
-                border-radius: 4px;
-                padding: 4px;
-            }
-            QLabel:hover {
-                background-color: #3d3d3d;
-            }
-        """)
         self.setCursor(Qt.PointingHandCursor)
-        self.load_thumbnail()
+        self.loader = None
+        self.set_image(meta, index, priority)
+
+    def set_image(self, meta, index, priority=0):
+        """Point this label at another image, e.g. when reused from the pool."""
+        self.cancel_load()
+        self.image_path = meta[0]
+        self.cache_key = pixmap_cache_key(meta, 140, 140)
+        self.index = index
+        self.clear()
+        self.load_thumbnail(priority)
 
-    def load_thumbnail(self):
-        pixmap = QPixmap(self.image_path)
-        if not pixmap.isNull():
-            scaled = pixmap.scaled(140, 140, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            self.setPixmap(scaled)
+    def load_thumbnail(self, priority=0):
+        pixmap = QPixmapCache.find(self.cache_key)
+        if pixmap is not None:
+            self.setPixmap(pixmap)
+            return
+
+        # Decode in the thread pool; only the QPixmap is made on the GUI thread
+        self.loader = ThumbLoader(self.image_path)
+        self.loader.signals.loaded.connect(self.set_thumbnail)
+        QThreadPool.globalInstance().start(self.loader, priority)
+
+    def cancel_load(self):
+        if self.loader:
+            self.loader.cancelled = True
+
+    def set_thumbnail(self, image_path, image):
+        # Ignore results that arrive after the label was reused
+        if image_path == self.image_path and not image.isNull():
+            pixmap = QPixmap.fromImage(image)
+            QPixmapCache.insert(self.cache_key, pixmap)
+            self.setPixmap(pixmap)
 
     def enterEvent(self, event):
         self.gallery.show_magnified(self.image_path, self.index)
@@ -118,13 +496,37 @@ class GalleryApp(QMainWindow):
     def __init__(self):
         super().__init__()
         self.images = []
+        self.image_meta = []
+        self.basenames = []
         self.current_index = 0
         self.current_view = 'gallery'
-        self.thumbnail_widgets = []
+        self.thumbnail_widgets = {}
+        self.grid_cells = []
+        self.thumbnail_pool = []
+        self.source_meta = None
+        self.source_pixmap = None
+        self.shown_image = None
+        self.prefetching = {}
+        # Rescale once the window stops resizing rather than on every step
+        self.resize_timer = QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.setInterval(120)
+        self.resize_timer.timeout.connect(self.show_image)
+        # Likewise only magnify the thumbnail the pointer settles on
+        self.pending_magnify = None
+        self.magnify_timer = QTimer(self)
+        self.magnify_timer.setSingleShot(True)
+        self.magnify_timer.setInterval(80)
+        self.magnify_timer.timeout.connect(self.update_magnified)
         self.current_folder = None
+        self.scan_id = 0
         self.sort_method = 'name_asc'
         self.settings = QSettings('anarchygames', 'gall-array')
+        QThreadPool.globalInstance().setMaxThreadCount(THUMBNAIL_THREADS)
+        QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
+        QThreadPool.globalInstance().start(ThumbnailCachePruner(), CACHE_PRUNE_PRIORITY)
         self.recent_dirs = self.load_recent_dirs()
+        self.isdir_cache = {}
         self.sort_method = self.settings.value('sort_method', 'name_asc')
         self.init_ui()
 
@@ -138,6 +540,8 @@ class GalleryApp(QMainWindow):
         self.settings.setValue('recent_dirs', self.recent_dirs)
 
     def add_recent_dir(self, folder):
+        # It was just opened, so it is known to exist
+        self.isdir_cache[folder] = (time.monotonic(), True)
         if folder in self.recent_dirs:
             self.recent_dirs.remove(folder)
         self.recent_dirs.insert(0, folder)
@@ -148,12 +552,6 @@ class GalleryApp(QMainWindow):
     def init_ui(self):
         self.setWindowTitle("Gall-array")
         self.setMinimumSize(1100, 700)
-        self.setStyleSheet(DARK_STYLE)
-
-        # Set window icon
-        icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'galleray.png')
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
 
         central = QWidget()
         self.setCentralWidget(central)
@@ -197,25 +595,7 @@ class GalleryApp(QMainWindow):
         # Sort button with dropdown
         self.sort_btn = QPushButton("Sort")
         self.sort_menu = QMenu(self)
-        self.sort_menu.setStyleSheet("""
-            QMenu {
-                background-color: #2d2d2d;
-                border: 1px solid #444;
-                border-radius: 4px;
-                padding: 4px;
-            }
-            QMenu::item {
-                color: #e0e0e0;
-                padding: 8px 20px;
-                border-radius: 4px;
-            }
-            QMenu::item:selected {
-                background-color: #3d3d3d;
-            }
-            QMenu::item:checked {
-                background-color: #4a4a4a;
-            }
-        """)
+        self.sort_menu.setObjectName("sortMenu")
 
         self.sort_actions = {}
         sort_options = [
@@ -239,7 +619,7 @@ class GalleryApp(QMainWindow):
         top_bar.addStretch()
 
         self.counter_label = QLabel("")
-        self.counter_label.setStyleSheet("font-size: 14px;")
+        self.counter_label.setObjectName("counterLabel")
         top_bar.addWidget(self.counter_label)
         layout.addLayout(top_bar)
 
@@ -255,12 +635,12 @@ class GalleryApp(QMainWindow):
         self.image_label = QLabel("Select a folder to view images")
         self.image_label.setAlignment(Qt.AlignCenter)
         self.image_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.image_label.setStyleSheet("font-size: 16px; color: #666;")
+        self.image_label.setObjectName("imageLabel")
         gallery_layout.addWidget(self.image_label, 1)
 
         self.filename_label = QLabel("")
         self.filename_label.setAlignment(Qt.AlignCenter)
-        self.filename_label.setStyleSheet("font-size: 12px; color: #888;")
+        self.filename_label.setObjectName("filenameLabel")
         gallery_layout.addWidget(self.filename_label)
 
         # Navigation buttons
@@ -272,22 +652,7 @@ class GalleryApp(QMainWindow):
         nav_layout.addWidget(self.prev_btn)
 
         self.delete_btn = QPushButton("Delete")
-        self.delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #5c2626;
-                color: #e0e0e0;
-            }
-            QPushButton:hover {
-                background-color: #7a3333;
-            }
-            QPushButton:pressed {
-                background-color: #8a4444;
-            }
-            QPushButton:disabled {
-                background-color: #3a2020;
-                color: #666666;
-            }
-        """)
+        self.delete_btn.setObjectName("deleteBtn")
         self.delete_btn.clicked.connect(self.delete_current_image)
         self.delete_btn.setEnabled(False)
         nav_layout.addWidget(self.delete_btn)
@@ -302,9 +667,12 @@ class GalleryApp(QMainWindow):
         self.stack.addWidget(self.gallery_widget)
 
         # List view
-        self.list_widget = QListWidget()
-        self.list_widget.itemDoubleClicked.connect(self.list_item_clicked)
-        self.stack.addWidget(self.list_widget)
+        self.list_model = ImageListModel(self)
+        self.list_view = QListView()
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setModel(self.list_model)
+        self.list_view.doubleClicked.connect(self.list_item_clicked)
+        self.stack.addWidget(self.list_view)
 
         # Grid view container
         self.grid_container = QWidget()
@@ -320,28 +688,26 @@ class GalleryApp(QMainWindow):
         self.grid_layout = QGridLayout(self.grid_content)
         self.grid_layout.setSpacing(10)
         self.grid_scroll.setWidget(self.grid_content)
+        scroll_bar = self.grid_scroll.verticalScrollBar()
+        scroll_bar.valueChanged.connect(lambda _: self.update_visible_thumbnails())
+        scroll_bar.rangeChanged.connect(lambda *_: self.update_visible_thumbnails())
         grid_container_layout.addWidget(self.grid_scroll, 2)
 
         # Magnified preview panel
         self.magnified_panel = QFrame()
         self.magnified_panel.setFixedWidth(350)
-        self.magnified_panel.setStyleSheet("""
-            QFrame {
-                background-color: #252525;
-                border-radius: 8px;
-            }
-        """)
+        self.magnified_panel.setObjectName("magnifiedPanel")
         magnified_layout = QVBoxLayout(self.magnified_panel)
 
         self.magnified_label = QLabel("Hover over a thumbnail")
         self.magnified_label.setAlignment(Qt.AlignCenter)
         self.magnified_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.magnified_label.setStyleSheet("color: #666;")
+        self.magnified_label.setObjectName("magnifiedLabel")
         magnified_layout.addWidget(self.magnified_label)
 
         self.magnified_name = QLabel("")
         self.magnified_name.setAlignment(Qt.AlignCenter)
-        self.magnified_name.setStyleSheet("font-size: 11px; color: #888; padding: 8px;")
+        self.magnified_name.setObjectName("magnifiedName")
         self.magnified_name.setWordWrap(True)
         magnified_layout.addWidget(self.magnified_name)
 
@@ -355,16 +721,16 @@ class GalleryApp(QMainWindow):
 
         website_link = QLabel('<a href="https://anarchygames.org" style="color: #666; text-decoration: none;">anarchygames.org</a>')
         website_link.setOpenExternalLinks(True)
-        website_link.setStyleSheet("font-size: 11px;")
+        website_link.setObjectName("footerLink")
         footer.addWidget(website_link)
 
         separator = QLabel("  |  ")
-        separator.setStyleSheet("font-size: 11px; color: #444;")
+        separator.setObjectName("footerSeparator")
         footer.addWidget(separator)
 
         donate_link = QLabel('<a href="https://ko-fi.com/O5O71TOKUE" style="color: #666; text-decoration: none;">Support on Ko-fi</a>')
         donate_link.setOpenExternalLinks(True)
-        donate_link.setStyleSheet("font-size: 11px;")
+        donate_link.setObjectName("footerLink")
         footer.addWidget(donate_link)
 
         footer.addStretch()
@@ -375,52 +741,22 @@ class GalleryApp(QMainWindow):
         # Right sidebar - Recent directories
         self.recent_panel = QFrame()
         self.recent_panel.setFixedWidth(220)
-        self.recent_panel.setStyleSheet("""
-            QFrame {
-                background-color: #252525;
-                border-radius: 8px;
-            }
-        """)
+        self.recent_panel.setObjectName("recentPanel")
         recent_layout = QVBoxLayout(self.recent_panel)
         recent_layout.setContentsMargins(12, 12, 12, 12)
         recent_layout.setSpacing(8)
 
         recent_header = QLabel("Recent Folders")
-        recent_header.setStyleSheet("font-size: 13px; font-weight: bold; color: #ccc; padding: 4px;")
+        recent_header.setObjectName("recentHeader")
         recent_layout.addWidget(recent_header)
 
         self.recent_list = QListWidget()
-        self.recent_list.setStyleSheet("""
-            QListWidget {
-                background-color: transparent;
-                border: none;
-                padding: 0;
-            }
-            QListWidget::item {
-                color: #aaa;
-                padding: 6px 8px;
-                border-radius: 4px;
-                font-size: 12px;
-            }
-            QListWidget::item:hover {
-                background-color: #3d3d3d;
-                color: #e0e0e0;
-            }
-            QListWidget::item:selected {
-                background-color: #4a4a4a;
-            }
-        """)
+        self.recent_list.setObjectName("recentList")
         self.recent_list.itemClicked.connect(self.recent_dir_clicked)
         recent_layout.addWidget(self.recent_list, 1)
 
         clear_btn = QPushButton("Clear History")
-        clear_btn.setStyleSheet("""
-            QPushButton {
-                padding: 8px 12px;
-                font-size: 11px;
-                background-color: #333;
-            }
-        """)
+        clear_btn.setObjectName("clearHistoryBtn")
         clear_btn.clicked.connect(self.clear_recent)
         recent_layout.addWidget(clear_btn)
 
@@ -431,7 +767,7 @@ class GalleryApp(QMainWindow):
     def update_recent_list(self):
         self.recent_list.clear()
         for folder in self.recent_dirs:
-            if os.path.isdir(folder):
+            if self.isdir_cached(folder):
                 # Show just the folder name, store full path
                 display_name = os.path.basename(folder) or folder
                 item = QListWidgetItem(display_name)
@@ -439,6 +775,16 @@ class GalleryApp(QMainWindow):
                 item.setToolTip(folder)
                 self.recent_list.addItem(item)
 
+    def isdir_cached(self, folder):
+        """os.path.isdir, remembered for RECENT_DIR_CHECK_TTL seconds."""
+        now = time.monotonic()
+        cached = self.isdir_cache.get(folder)
+        if cached and now - cached[0] < RECENT_DIR_CHECK_TTL:
+            return cached[1]
+        result = os.path.isdir(folder)
+        self.isdir_cache[folder] = (now, result)
+        return result
+
     def recent_dir_clicked(self, item):
         folder = item.data(Qt.UserRole)
         if folder and os.path.isdir(folder):
@@ -446,6 +792,7 @@ class GalleryApp(QMainWindow):
 
     def clear_recent(self):
         self.recent_dirs = []
+        self.isdir_cache.clear()
         self.save_recent_dirs()
         self.update_recent_list()
 
@@ -457,24 +804,13 @@ class GalleryApp(QMainWindow):
         for key, action in self.sort_actions.items():
             action.setChecked(key == method)
 
-        # Re-sort current images
-        if self.current_folder:
-            self.load_images(self.current_folder, add_to_recent=False)
-
-    def sort_images(self, image_paths):
-        if self.sort_method == 'name_asc':
-            return sorted(image_paths, key=lambda p: os.path.basename(p).lower())
-        elif self.sort_method == 'name_desc':
-            return sorted(image_paths, key=lambda p: os.path.basename(p).lower(), reverse=True)
-        elif self.sort_method == 'date_newest':
-            return sorted(image_paths, key=lambda p: os.path.getmtime(p), reverse=True)
-        elif self.sort_method == 'date_oldest':
-            return sorted(image_paths, key=lambda p: os.path.getmtime(p))
-        elif self.sort_method == 'size_largest':
-            return sorted(image_paths, key=lambda p: os.path.getsize(p), reverse=True)
-        elif self.sort_method == 'size_smallest':
-            return sorted(image_paths, key=lambda p: os.path.getsize(p))
-        return image_paths
+        # Re-sort current images from the metadata gathered by the last scan
+        if self.image_meta:
+            self.set_image_meta(self.image_meta)
+
+    def sort_images(self, image_meta):
+        key, reverse = SORT_KEYS.get(self.sort_method, SORT_KEYS['name_asc'])
+        return sorted(image_meta, key=key, reverse=reverse)
 
     def set_view_mode(self, mode):
         self.current_view = mode
@@ -490,6 +826,7 @@ class GalleryApp(QMainWindow):
             self.stack.setCurrentIndex(1)
         elif mode == 'grid':
             self.stack.setCurrentIndex(2)
+            self.update_visible_thumbnails()
 
     def open_folder(self):
         folder = QFileDialog.getExistingDirectory(self, "Select Image Folder")
@@ -497,18 +834,38 @@ class GalleryApp(QMainWindow):
             self.load_images(folder)
 
     def load_images(self, folder, add_to_recent=True):
-        self.current_folder = folder
-        image_paths = [
-            os.path.join(folder, f) for f in os.listdir(folder)
-            if Path(f).suffix.lower() in SUPPORTED_FORMATS
-        ]
-        self.images = self.sort_images(image_paths)
-        self.current_index = 0
-
         # Add to recent dirs
         if add_to_recent:
             self.add_recent_dir(folder)
 
+        # Scan in the thread pool, ahead of any queued thumbnail jobs;
+        # results from a superseded scan are dropped in on_scan_complete
+        self.scan_id += 1
+        scanner = FolderScanner(folder, self.scan_id)
+        scanner.signals.finished.connect(self.on_scan_complete)
+        # A rescan of the current folder keeps showing it until results arrive
+        if folder != self.current_folder:
+            self.image_label.setPixmap(QPixmap())
+            self.image_label.setText("Scanning...")
+        self.current_folder = folder
+        QThreadPool.globalInstance().start(scanner, SCAN_PRIORITY)
+
+    def on_scan_complete(self, scan_id, image_meta):
+        if scan_id != self.scan_id:
+            return
+        # Nothing to rebuild if no file was added, removed or changed; the
+        # paths in image_meta also tell a different folder apart
+        if image_meta and self.sort_images(image_meta) == self.image_meta:
+            return
+        self.set_image_meta(image_meta)
+
+    def set_image_meta(self, image_meta):
+        """Sort the scanned image metadata and show the result in every view."""
+        self.image_meta = self.sort_images(image_meta)
+        self.images = [meta[0] for meta in self.image_meta]
+        self.basenames = [meta[4] for meta in self.image_meta]
+        self.current_index = 0
+
         if self.images:
             self.show_image()
             self.update_nav_state()
@@ -522,46 +879,144 @@ class GalleryApp(QMainWindow):
             self.filename_label.setText("")
             self.prev_btn.setEnabled(False)
             self.next_btn.setEnabled(False)
-            self.list_widget.clear()
+            self.populate_list()
             self.clear_grid()
 
     def populate_list(self):
-        self.list_widget.clear()
-        for i, path in enumerate(self.images):
-            item = QListWidgetItem(f"{i + 1}. {os.path.basename(path)}")
-            item.setData(Qt.UserRole, i)
-            self.list_widget.addItem(item)
-
-    def list_item_clicked(self, item):
-        self.current_index = item.data(Qt.UserRole)
+        # Rows are read from self.images on demand
+        self.list_model.beginResetModel()
+        self.list_model.endResetModel()
+
+    def list_item_clicked(self, index):
+        self.current_index = index.row()
         self.set_view_mode('gallery')
 
     def clear_grid(self):
-        for widget in self.thumbnail_widgets:
-            widget.deleteLater()
-        self.thumbnail_widgets.clear()
+        self.release_thumbnails(self.thumbnail_widgets.values())
+        self.thumbnail_widgets = {}
+        self.resize_grid(0)
 
     def populate_grid(self):
-        self.clear_grid()
-        cols = 4
-        for i, path in enumerate(self.images):
-            thumb = ThumbnailLabel(path, i, self)
-            self.thumbnail_widgets.append(thumb)
-            row, col = divmod(i, cols)
-            self.grid_layout.addWidget(thumb, row, col)
+        # Cells and thumbnails are reused rather than rebuilt per folder
+        self.release_thumbnails(self.thumbnail_widgets.values())
+        self.thumbnail_widgets = {}
+        self.resize_grid(len(self.images))
+        self.update_visible_thumbnails()
+
+    def resize_grid(self, count):
+        """Grow or shrink the empty grid cells to count, keeping existing ones."""
+        # Suspend the layout so it is recalculated once, not per cell
+        self.grid_content.setUpdatesEnabled(False)
+        self.grid_layout.setEnabled(False)
+        try:
+            for i in range(len(self.grid_cells), count):
+                cell = QWidget()
+                cell.setFixedSize(150, 150)
+                self.grid_cells.append(cell)
+                row, col = divmod(i, GRID_COLUMNS)
+                self.grid_layout.addWidget(cell, row, col)
+            for cell in self.grid_cells[count:]:
+                self.grid_layout.removeWidget(cell)
+                cell.deleteLater()
+            del self.grid_cells[count:]
+        finally:
+            self.grid_layout.setEnabled(True)
+            self.grid_layout.activate()
+            self.grid_content.setUpdatesEnabled(True)
+
+    def release_thumbnails(self, thumbs):
+        """Hide thumbs and return them to the pool for reuse."""
+        for thumb in thumbs:
+            thumb.cancel_load()
+            # Detach from its cell so the cell can be deleted independently
+            thumb.setParent(self.grid_content)
+            thumb.hide()
+        self.thumbnail_pool.extend(thumbs)
+
+    def update_visible_thumbnails(self):
+        """Create thumbnails for rows near the viewport and drop the rest."""
+        if not self.grid_cells:
+            return
+
+        row_height = 150 + self.grid_layout.verticalSpacing()
+        top = self.grid_scroll.verticalScrollBar().value()
+        bottom = top + self.grid_scroll.viewport().height()
+        first_row = max(top // row_height - GRID_OVERSCAN_ROWS, 0)
+        last_row = bottom // row_height + GRID_OVERSCAN_ROWS
+        start = first_row * GRID_COLUMNS
+        end = min((last_row + 1) * GRID_COLUMNS, len(self.grid_cells))
+        # Rows actually on screen are decoded ahead of the overscan rows
+        on_screen = range(
+            top // row_height * GRID_COLUMNS, (bottom // row_height + 1) * GRID_COLUMNS
+        )
+
+        visible = range(start, end)
+        self.release_thumbnails([
+            self.thumbnail_widgets.pop(i) for i in list(self.thumbnail_widgets)
+            if i not in visible
+        ])
+
+        for i in visible:
+            if i not in self.thumbnail_widgets:
+                priority = VISIBLE_THUMBNAIL_PRIORITY if i in on_screen else 0
+                if self.thumbnail_pool:
+                    thumb = self.thumbnail_pool.pop()
+                    thumb.setParent(self.grid_cells[i])
+                    thumb.set_image(self.image_meta[i], i, priority)
+                else:
+                    thumb = ThumbnailLabel(
+                        self.image_meta[i], i, self, self.grid_cells[i], priority
+                    )
+                thumb.show()
+                self.thumbnail_widgets[i] = thumb
+
+    def remove_image(self, index):
+        """Drop one image, updating the list and grid in place."""
+        self.list_model.beginRemoveRows(QModelIndex(), index, index)
+        self.images.pop(index)
+        self.image_meta.pop(index)
+        self.basenames.pop(index)
+        self.list_model.endRemoveRows()
+        # Later rows are numbered, so their text changes too
+        if index < len(self.images):
+            self.list_model.dataChanged.emit(
+                self.list_model.index(index), self.list_model.index(len(self.images) - 1)
+            )
+
+        # Release the thumbnail in the cell that goes away, then move the
+        # later thumbnails up one image; they are mostly in QPixmapCache
+        last = self.thumbnail_widgets.pop(len(self.images), None)
+        if last:
+            self.release_thumbnails([last])
+        self.resize_grid(len(self.images))
+        for i, thumb in self.thumbnail_widgets.items():
+            if i >= index:
+                thumb.set_image(self.image_meta[i], i)
+        self.update_visible_thumbnails()
 
     def show_magnified(self, path, index):
-        pixmap = QPixmap(path)
+        self.pending_magnify = (path, index)
+        self.magnify_timer.start()
+
+    def update_magnified(self):
+        path, index = self.pending_magnify
+        if index >= len(self.images) or self.images[index] != path:
+            return
+
+        width = self.magnified_label.width()
+        height = self.magnified_label.height()
+        key = pixmap_cache_key(self.image_meta[index], width, height)
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = QPixmap.fromImage(read_scaled_image(path, width, height))
+            if not pixmap.isNull():
+                QPixmapCache.insert(key, pixmap)
         if not pixmap.isNull():
-            scaled = pixmap.scaled(
-                self.magnified_label.size(),
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
-            self.magnified_label.setPixmap(scaled)
-        self.magnified_name.setText(f"{index + 1}. {os.path.basename(path)}")
+            self.magnified_label.setPixmap(pixmap)
+        self.magnified_name.setText(f"{index + 1}. {self.basenames[index]}")
 
     def hide_magnified(self):
+        self.magnify_timer.stop()
         self.magnified_label.clear()
         self.magnified_label.setText("Hover over a thumbnail")
         self.magnified_name.setText("")
@@ -570,20 +1025,74 @@ class GalleryApp(QMainWindow):
         if not self.images:
             return
 
-        path = self.images[self.current_index]
-        pixmap = QPixmap(path)
+        meta = self.image_meta[self.current_index]
+        size = self.image_label.size()
 
-        if not pixmap.isNull():
-            scaled = pixmap.scaled(
-                self.image_label.size(),
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
-            self.image_label.setPixmap(scaled)
+        # Nothing to redraw if the label already shows this version of the
+        # image at this size
+        key = pixmap_cache_key(meta, size.width(), size.height())
+        shown = self.image_label.pixmap()
+        if key != self.shown_image or shown is None or shown.isNull():
+            pixmap = self.get_scaled_pixmap(meta, size)
+            if not pixmap.isNull():
+                self.image_label.setPixmap(pixmap)
+                self.shown_image = key
 
         self.counter_label.setText(f"{self.current_index + 1} / {len(self.images)}")
-        self.filename_label.setText(os.path.basename(path))
+        self.filename_label.setText(self.basenames[self.current_index])
         self.update_nav_state()
+        self.prefetch_neighbours()
+
+    def get_scaled_pixmap(self, meta, size):
+        """Return meta's image scaled to fit size, from QPixmapCache when possible.
+
+        The decoded original is kept so later rescales of the same image
+        (e.g. on resize) skip decoding it again.
+        """
+        key = pixmap_cache_key(meta, size.width(), size.height())
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None:
+            return pixmap
+
+        # Compare mtime and size too, so a file changed on disk is re-read
+        if meta[:3] == self.source_meta:
+            source = self.source_pixmap
+        else:
+            reader = QImageReader(meta[0])
+            reader.setAutoTransform(True)
+            source = QPixmap.fromImage(reader.read())
+            self.source_meta = meta[:3]
+            self.source_pixmap = source
+        if source.isNull():
+            return source
+        pixmap = source.scaled(size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def prefetch_neighbours(self):
+        """Decode the images either side of the current one in the background."""
+        width = self.image_label.width()
+        height = self.image_label.height()
+        for index in (self.current_index - 1, self.current_index + 1):
+            if not 0 <= index < len(self.images):
+                continue
+            meta = self.image_meta[index]
+            key = pixmap_cache_key(meta, width, height)
+            if key in self.prefetching or QPixmapCache.find(key) is not None:
+                continue
+            # Keep the loader referenced until its result has been delivered
+            loader = ImageLoader(meta[0], width, height)
+            loader.signals.loaded.connect(
+                lambda _, image, key=key: self.on_prefetched(key, image)
+            )
+            self.prefetching[key] = loader
+            QThreadPool.globalInstance().start(loader)
+
+    def on_prefetched(self, key, image):
+        self.prefetching.pop(key, None)
+        if not image.isNull():
+            QPixmapCache.insert(key, QPixmap.fromImage(image))
 
     def update_nav_state(self):
         has_images = len(self.images) > 0
@@ -595,8 +1104,8 @@ class GalleryApp(QMainWindow):
         if not self.images:
             return
 
-        path = self.images[self.current_index]
-        filename = os.path.basename(path)
+        meta = self.image_meta[self.current_index]
+        path, filename = meta[0], meta[4]
 
         reply = QMessageBox.question(
             self,
@@ -609,7 +1118,12 @@ class GalleryApp(QMainWindow):
         if reply == QMessageBox.Yes:
             try:
                 os.remove(path)
-                self.images.pop(self.current_index)
+                # Nothing would read its cached thumbnail again
+                try:
+                    os.remove(thumbnail_cache_path(*meta[:3]))
+                except OSError:
+                    pass
+                self.remove_image(self.current_index)
 
                 if not self.images:
                     self.image_label.setPixmap(QPixmap())
@@ -617,14 +1131,10 @@ class GalleryApp(QMainWindow):
                     self.counter_label.setText("")
                     self.filename_label.setText("")
                     self.update_nav_state()
-                    self.populate_list()
-                    self.populate_grid()
                 else:
                     if self.current_index >= len(self.images):
                         self.current_index = len(self.images) - 1
                     self.show_image()
-                    self.populate_list()
-                    self.populate_grid()
             except OSError as e:
                 QMessageBox.warning(self, "Error", f"Could not delete file:\n{e}")
 
@@ -656,11 +1166,18 @@ class GalleryApp(QMainWindow):
     def resizeEvent(self, event):
         super().resizeEvent(event)
         if self.images and self.current_view == 'gallery':
-            self.show_image()
+            self.resize_timer.start()
+        elif self.current_view == 'grid':
+            self.update_visible_thumbnails()
 
 
 def main():
     app = QApplication(sys.argv)
+    # Application-wide, so the stylesheet is parsed and the icon loaded once
+    app.setStyleSheet(DARK_STYLE)
+    if os.path.exists(ICON_PATH):
+        app.setWindowIcon(QIcon(ICON_PATH))
+
     gallery = GalleryApp()
     gallery.show()
 